@@ -40,13 +40,12 @@ thirdparty_libs = [
 ]
 
 # build the third-party libraries
-for x in thirdparty_libs:
-    toolchain = AndroidNdkToolchain(mpd_path, lib_path,
-                                    tarball_path, src_path,
-                                    ndk_path, android_abi,
-                                    use_cxx=x.use_cxx)
-    if not x.is_installed(toolchain):
-        x.build(toolchain)
+from build.parallel import build_all
+build_all(thirdparty_libs,
+          lambda x: AndroidNdkToolchain(mpd_path, lib_path,
+                                        tarball_path, src_path,
+                                        ndk_path, android_abi,
+                                        use_cxx=x.use_cxx))
 
 # configure and build MPD
 toolchain = AndroidNdkToolchain(mpd_path, lib_path,
@@ -2,6 +2,7 @@ import os.path, subprocess, sys
 from typing import Collection, Iterable, Optional, Sequence, Union
 from collections.abc import Mapping
 
+from build.project import get_command_digest
 from build.makeproject import MakeProject
 from .toolchain import AnyToolchain
 
@@ -11,6 +12,8 @@ class AutotoolsProject(MakeProject):
                  autogen: bool=False,
                  autoreconf: bool=False,
                  per_arch_cflags: Optional[Mapping[str, str]]=None,
+                 cflags: str='',
+                 cxxflags: str='',
                  cppflags: str='',
                  ldflags: str='',
                  libs: str='',
@@ -21,25 +24,15 @@ class AutotoolsProject(MakeProject):
         self.autogen = autogen
         self.autoreconf = autoreconf
         self.per_arch_cflags = per_arch_cflags
+        self.cflags = cflags
+        self.cxxflags = cxxflags
         self.cppflags = cppflags
         self.ldflags = ldflags
         self.libs = libs
         self.subdirs = subdirs
 
-    def configure(self, toolchain: AnyToolchain) -> str:
-        src = self.unpack(toolchain)
-        if self.autogen:
-            if sys.platform == 'darwin':
-                subprocess.check_call(['glibtoolize', '--force'], cwd=src)
-            else:
-                subprocess.check_call(['libtoolize', '--force'], cwd=src)
-            subprocess.check_call(['aclocal'], cwd=src)
-            subprocess.check_call(['automake', '--add-missing', '--force-missing', '--foreign'], cwd=src)
-            subprocess.check_call(['autoconf'], cwd=src)
-        if self.autoreconf:
-            subprocess.check_call(['autoreconf', '-vif'], cwd=src)
-
-        build = self.make_build_path(toolchain)
+    def get_configure_command(self, toolchain: AnyToolchain) -> tuple[list[str], Mapping[str, str]]:
+        src = self.get_src_path(toolchain)
 
         arch_cflags = ''
         if self.per_arch_cflags is not None and toolchain.host_triplet is not None:
@@ -49,8 +42,8 @@ class AutotoolsProject(MakeProject):
             os.path.join(src, 'configure'),
             'CC=' + toolchain.cc,
             'CXX=' + toolchain.cxx,
-            'CFLAGS=' + toolchain.cflags + ' ' + arch_cflags,
-            'CXXFLAGS=' + toolchain.cxxflags + ' ' + arch_cflags,
+            'CFLAGS=' + toolchain.cflags + ' ' + arch_cflags + ' ' + self.cflags,
+            'CXXFLAGS=' + toolchain.cxxflags + ' ' + arch_cflags + ' ' + self.cxxflags,
             'CPPFLAGS=' + toolchain.cppflags + ' ' + self.cppflags,
             'LDFLAGS=' + toolchain.ldflags + ' ' + self.ldflags,
             'LIBS=' + toolchain.libs + ' ' + self.libs,
@@ -60,6 +53,7 @@ class AutotoolsProject(MakeProject):
             'STRIP=' + toolchain.strip,
             '--prefix=' + toolchain.install_prefix,
             '--disable-silent-rules',
+            '--disable-shared', '--enable-static',
         ]
 
         if toolchain.host_triplet is not None:
@@ -67,9 +61,41 @@ class AutotoolsProject(MakeProject):
 
         configure.extend(self.configure_args)
 
+        return configure, toolchain.env
+
+    def get_configure_digest(self, toolchain: AnyToolchain) -> str:
+        command, env = self.get_configure_command(toolchain)
+        return get_command_digest(command, env,
+                                  f'autogen={self.autogen}',
+                                  f'autoreconf={self.autoreconf}')
+
+    def configure(self, toolchain: AnyToolchain) -> str:
+        src = self.unpack(toolchain)
+
+        # skip the configure step if the previous one used the same
+        # settings
+        digest = self.get_configure_digest(toolchain)
+        if self.is_configured(toolchain, 'config.status', digest) and \
+           os.path.isfile(os.path.join(src, 'configure')):
+            return self.get_build_path(toolchain)
+
+        if self.autogen:
+            if sys.platform == 'darwin':
+                subprocess.check_call(['glibtoolize', '--force'], cwd=src)
+            else:
+                subprocess.check_call(['libtoolize', '--force'], cwd=src)
+            subprocess.check_call(['aclocal'], cwd=src)
+            subprocess.check_call(['automake', '--add-missing', '--force-missing', '--foreign'], cwd=src)
+            subprocess.check_call(['autoconf'], cwd=src)
+        if self.autoreconf:
+            subprocess.check_call(['autoreconf', '-vif'], cwd=src)
+
+        build = self.make_build_path(toolchain)
+        configure, env = self.get_configure_command(toolchain)
+
         try:
             print(configure)
-            subprocess.check_call(configure, cwd=build, env=toolchain.env)
+            subprocess.check_call(configure, cwd=build, env=env)
         except subprocess.CalledProcessError:
             # dump config.log after a failed configure run
             try:
@@ -80,6 +106,7 @@ class AutotoolsProject(MakeProject):
             # re-raise the exception
             raise
 
+        self.write_configure_digest(build, digest)
         return build
 
     def _build(self, toolchain: AnyToolchain) -> None:
@@ -0,0 +1,26 @@
+import os, tarfile
+from typing import Optional
+
+# the directory where archives of built projects are stored; caching
+# is disabled if this environment variable is not set
+cache_path: Optional[str] = os.environ.get('MPD_BUILD_CACHE')
+
+def store(archive_path: str, root: str) -> None:
+    """Create an archive containing all files below the given
+    directory."""
+
+    os.makedirs(os.path.dirname(archive_path), exist_ok=True)
+    tmp_path = archive_path + '.tmp'
+    with tarfile.open(tmp_path, 'w:gz') as tar:
+        for name in sorted(os.listdir(root)):
+            tar.add(os.path.join(root, name), name)
+    os.rename(tmp_path, archive_path)
+
+def restore(archive_path: str, root: str) -> None:
+    """Extract an archive created by store() into the given directory."""
+
+    with tarfile.open(archive_path) as tar:
+        if hasattr(tarfile, 'data_filter'):
+            tar.extractall(root, filter='data')
+        else:
+            tar.extractall(root)
@@ -1,10 +1,10 @@
-import os
+import io, os
 import re
 import subprocess
-from typing import cast, Optional, Sequence, TextIO, Union
+from typing import cast, Iterable, Optional, Sequence, TextIO, Union
 from collections.abc import Mapping
 
-from build.project import Project
+from build.project import Project, get_command_digest
 from .toolchain import AnyToolchain
 
 def __write_cmake_compiler(f: TextIO, language: str, compiler: str) -> None:
@@ -44,7 +44,18 @@ set(CMAKE_FIND_ROOT_PATH_MODE_LIBRARY ONLY)
 set(CMAKE_FIND_ROOT_PATH_MODE_INCLUDE ONLY)
 """)
 
-def configure(toolchain: AnyToolchain, src: str, build: str, args: list[str]=[], env: Optional[Mapping[str, str]]=None) -> None:
+def get_toolchain_file_contents(toolchain: AnyToolchain) -> Optional[str]:
+    """Return the contents of the CMake toolchain file, or None if
+    not cross-compiling."""
+
+    if toolchain.host_triplet is None:
+        return None
+
+    f = io.StringIO()
+    __write_cmake_toolchain_file(f, toolchain)
+    return f.getvalue()
+
+def get_configure_command(toolchain: AnyToolchain, src: str, build: str, args: list[str]=[], env: Optional[Mapping[str, str]]=None) -> tuple[list[str], Mapping[str, str]]:
     cross_args: list[str] = []
 
     if toolchain.is_windows:
@@ -56,14 +67,12 @@ def configure(toolchain: AnyToolchain, src: str, build: str, args: list[str]=[],
 
         '-DCMAKE_INSTALL_PREFIX=' + toolchain.install_prefix,
         '-DCMAKE_BUILD_TYPE=release',
+        '-DBUILD_SHARED_LIBS=OFF',
 
         '-GNinja',
     ] + cross_args + args
 
     if toolchain.host_triplet is not None:
-        # cross-compiling: write a toolchain file
-        os.makedirs(build, exist_ok=True)
-
         # Several targets need a sysroot to prevent pkg-config from
         # looking for libraries on the build host (TODO: fix this
         # properly); but we must not do that on Android because the NDK
@@ -71,10 +80,8 @@ def configure(toolchain: AnyToolchain, src: str, build: str, args: list[str]=[],
         if not toolchain.is_android and not toolchain.is_darwin:
             cross_args.append('-DCMAKE_SYSROOT=' + toolchain.install_prefix)
 
+        # cross-compiling: use a toolchain file (written by configure())
         cmake_toolchain_file = os.path.join(build, 'cmake_toolchain_file')
-        with open(cmake_toolchain_file, 'w') as f:
-            __write_cmake_toolchain_file(f, toolchain)
-
         configure.append('-DCMAKE_TOOLCHAIN_FILE=' + cmake_toolchain_file)
 
     if env is None:
@@ -82,13 +89,25 @@ def configure(toolchain: AnyToolchain, src: str, build: str, args: list[str]=[],
     else:
         env = {**toolchain.env, **env}
 
+    return configure, env
+
+def configure(toolchain: AnyToolchain, src: str, build: str, args: list[str]=[], env: Optional[Mapping[str, str]]=None) -> None:
+    configure, env = get_configure_command(toolchain, src, build, args, env)
+
+    toolchain_file_contents = get_toolchain_file_contents(toolchain)
+    if toolchain_file_contents is not None:
+        # cross-compiling: write a toolchain file
+        os.makedirs(build, exist_ok=True)
+        with open(os.path.join(build, 'cmake_toolchain_file'), 'w') as f:
+            f.write(toolchain_file_contents)
+
     print(configure)
     subprocess.check_call(configure, env=env, cwd=build)
 
 class CmakeProject(Project):
     def __init__(self, url: Union[str, Sequence[str]], md5: str, installed: str,
-                 configure_args: list[str]=[],
-                 windows_configure_args: list[str]=[],
+                 configure_args: Iterable[str]=[],
+                 windows_configure_args: Iterable[str]=[],
                  env: Optional[Mapping[str, str]]=None,
                  **kwargs):
         Project.__init__(self, url, md5, installed, **kwargs)
@@ -96,16 +115,42 @@ class CmakeProject(Project):
         self.windows_configure_args = windows_configure_args
         self.env = env
 
+    def get_configure_args(self, toolchain: AnyToolchain) -> list[str]:
+        configure_args = list(self.configure_args)
+        if toolchain.is_windows:
+            configure_args.extend(self.windows_configure_args)
+        return configure_args
+
+    def get_configure_command(self, toolchain: AnyToolchain) -> tuple[list[str], Mapping[str, str]]:
+        return get_configure_command(toolchain,
+                                     self.get_src_path(toolchain),
+                                     self.get_build_path(toolchain),
+                                     self.get_configure_args(toolchain),
+                                     self.env)
+
+    def get_configure_digest(self, toolchain: AnyToolchain) -> str:
+        command, env = self.get_configure_command(toolchain)
+        return get_command_digest(command, env,
+                                  get_toolchain_file_contents(toolchain) or '')
+
     def configure(self, toolchain: AnyToolchain) -> str:
         src = self.unpack(toolchain)
+
+        # skip the configure step if the previous one used the same
+        # settings
+        digest = self.get_configure_digest(toolchain)
+        if self.is_configured(toolchain, 'CMakeCache.txt', digest):
+            return self.get_build_path(toolchain)
+
         build = self.make_build_path(toolchain)
-        configure_args = self.configure_args
-        if toolchain.is_windows:
-            configure_args = configure_args + self.windows_configure_args
-        configure(toolchain, src, build, configure_args, self.env)
+        configure(toolchain, src, build, self.get_configure_args(toolchain), self.env)
+        self.write_configure_digest(build, digest)
         return build
 
     def _build(self, toolchain: AnyToolchain) -> None:
         build = self.configure(toolchain)
-        subprocess.check_call(['ninja', '-v', 'install'],
+        jobs_args = [] if self.jobs is None else ['-j' + str(self.jobs)]
+        if self.max_load is not None:
+            jobs_args.append('-l' + str(self.max_load))
+        subprocess.check_call(['ninja', '-v'] + jobs_args + ['install'],
                               cwd=build, env=toolchain.env)
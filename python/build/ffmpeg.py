@@ -1,25 +1,30 @@
-import os.path, subprocess
+import os.path, shutil, subprocess
+from typing import Collection
+from collections.abc import Mapping
 
-from build.project import Project
+from build.makeproject import MakeProject
 
-class FfmpegProject(Project):
+class FfmpegProject(MakeProject):
     def __init__(self, url, md5, installed, configure_args=[],
+                 disabled: Mapping[str, Collection[str]]={},
                  cppflags='',
                  **kwargs):
-        Project.__init__(self, url, md5, installed, **kwargs)
+        MakeProject.__init__(self, url, md5, installed, **kwargs)
         self.configure_args = configure_args
+        # sorted for a stable command line (and cache key)
+        self.disabled = {kind: sorted(names) for kind, names in disabled.items()}
         self.cppflags = cppflags
 
-    def _build(self, toolchain):
-        src = self.unpack(toolchain)
-        build = self.make_build_path(toolchain)
-
+    def get_configure_command(self, toolchain):
         if toolchain.is_arm:
             arch = 'arm'
+            asm_args = ['--enable-neon']
         elif toolchain.is_aarch64:
             arch = 'aarch64'
+            asm_args = ['--enable-neon']
         else:
             arch = 'x86'
+            asm_args = ['--enable-x86asm']
 
         if toolchain.is_windows:
             target_os = 'mingw32'
@@ -27,7 +32,7 @@ class FfmpegProject(Project):
             target_os = 'linux'
 
         configure = [
-            os.path.join(src, 'configure'),
+            os.path.join(self.get_src_path(toolchain), 'configure'),
             '--cc=' + toolchain.cc,
             '--cxx=' + toolchain.cxx,
             '--nm=' + toolchain.nm,
@@ -41,11 +46,32 @@ class FfmpegProject(Project):
             '--arch=' + arch,
             '--target-os=' + target_os,
             '--prefix=' + toolchain.install_prefix,
-        ] + self.configure_args
+            '--enable-asm',
+        ] + asm_args
+
+        configure.extend(self.configure_args)
+
+        # a comma-separated list disables many components with one
+        # option
+        for kind, names in self.disabled.items():
+            if names:
+                configure.append(f'--disable-{kind}=' + ','.join(names))
 
         if toolchain.is_armv7:
             configure.append('--cpu=cortex-a8')
 
-        subprocess.check_call(configure, cwd=build, env=toolchain.env)
-        subprocess.check_call(['/usr/bin/make', '--quiet', '-j12'], cwd=build, env=toolchain.env)
-        subprocess.check_call(['/usr/bin/make', '--quiet', 'install'], cwd=build, env=toolchain.env)
+        return configure, toolchain.env
+
+    def _build(self, toolchain):
+        if not toolchain.is_arm and not toolchain.is_aarch64:
+            # ffmpeg's configure would fail only after the tarball has
+            # been unpacked
+            if shutil.which('nasm') is None:
+                raise RuntimeError('nasm is required to build ffmpeg for x86')
+
+        self.unpack(toolchain)
+        build = self.make_build_path(toolchain)
+
+        configure, env = self.get_configure_command(toolchain)
+        subprocess.check_call(configure, cwd=build, env=env)
+        self.build_make(toolchain, build)
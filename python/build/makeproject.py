@@ -12,6 +12,9 @@ class MakeProject(Project):
         self.install_target = install_target
 
     def get_simultaneous_jobs(self) -> int:
+        if self.jobs is not None:
+            return self.jobs
+
         try:
             # use twice as many simultaneous jobs as we have CPU cores
             return multiprocessing.cpu_count() * 2
@@ -20,10 +23,21 @@ class MakeProject(Project):
             return 12
 
     def get_make_args(self, toolchain: AnyToolchain) -> list[str]:
-        return ['--quiet', '-j' + str(self.get_simultaneous_jobs())]
+        args = ['--quiet', '-j' + str(self.get_simultaneous_jobs())]
+        if self.max_load is not None:
+            args.append('-l' + str(self.max_load))
+        return args
+
+    def get_destdir_args(self, toolchain: AnyToolchain) -> list[str]:
+        # pass DESTDIR on the command line, because some makefiles
+        # (e.g. zlib's) assign it and would ignore the environment
+        destdir = toolchain.env.get('DESTDIR')
+        if destdir is None:
+            return []
+        return ['DESTDIR=' + destdir]
 
     def get_make_install_args(self, toolchain: AnyToolchain) -> list[str]:
-        return ['--quiet', self.install_target]
+        return ['--quiet', self.install_target] + self.get_destdir_args(toolchain)
 
     def make(self, toolchain: AnyToolchain, wd: str, args: list[str]) -> None:
         subprocess.check_call(['make'] + args,
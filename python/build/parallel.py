@@ -0,0 +1,104 @@
+import multiprocessing, os, sys
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Optional, Sequence
+
+from build.project import Project
+from .toolchain import AnyToolchain
+
+def __build_one(project: Project, toolchain: AnyToolchain, log_path: str) -> None:
+    """Build the project in a worker process, with all output
+    (including that of child processes) redirected to a log file."""
+
+    with open(log_path, 'w') as log:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        try:
+            if not project.is_installed(toolchain):
+                project.build(toolchain)
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+def __print_log(project: Project, log_path: str) -> None:
+    print("==>", project.name)
+    try:
+        with open(log_path) as f:
+            sys.stdout.write(f.read())
+    except FileNotFoundError:
+        # the worker failed before it could create the log
+        pass
+    sys.stdout.flush()
+
+def build_all(projects: Sequence[Project],
+              get_toolchain: Callable[[Project], AnyToolchain],
+              max_workers: Optional[int]=None,
+              max_download_workers: int=16) -> None:
+    """Build all projects which are not yet installed.  All tarballs
+    are downloaded concurrently first; then projects are built
+    concurrently as soon as all of their dependencies (which are part
+    of the given list) have been built.
+
+    Each build may use all CPU cores, but does not start new jobs
+    while the load average exceeds the number of cores, so concurrent
+    builds throttle each other.  The output of each project is printed
+    as a whole when it is finished.  After the first failure, no more
+    builds are started."""
+
+    toolchains = {project: get_toolchain(project) for project in projects}
+
+    # download and verify all tarballs before building anything
+    with ThreadPoolExecutor(max_download_workers) as executor:
+        for _ in executor.map(lambda p: p.download(toolchains[p]), projects):
+            pass
+
+    cpu_count = os.cpu_count() or 1
+    if max_workers is None:
+        max_workers = cpu_count
+
+    pending = list(projects)
+    running: dict[Future, Project] = {}
+    log_paths: dict[Project, str] = {}
+    failed: Optional[Future] = None
+
+    # worker processes are forked (not spawned), because the build
+    # scripts which call this function cannot be re-imported
+    with ProcessPoolExecutor(max_workers,
+                             mp_context=multiprocessing.get_context('fork')) as executor:
+        while running or (pending and failed is None):
+            if failed is None:
+                ready = [project for project in pending
+                         if not any(d in pending or d in running.values() for d in project.depends)]
+
+                # submit only as many as there are free workers, so
+                # nothing is queued behind a failure
+                for project in ready[:max_workers - len(running)]:
+                    pending.remove(project)
+                    project.jobs = cpu_count
+                    project.max_load = cpu_count
+
+                    toolchain = toolchains[project]
+                    os.makedirs(toolchain.build_path, exist_ok=True)
+                    log_path = os.path.join(toolchain.build_path, project.base + '.log')
+                    log_paths[project] = log_path
+
+                    running[executor.submit(__build_one, project, toolchain, log_path)] = project
+
+                if not running:
+                    raise RuntimeError('Circular dependency: ' +
+                                       ', '.join(p.name for p in pending))
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                project = running.pop(future)
+                __print_log(project, log_paths[project])
+
+                if failed is None and future.exception() is not None:
+                    # let the running builds finish (and print their
+                    # logs), but don't start new ones
+                    failed = future
+
+    if failed is not None:
+        # re-raise the exception of the first failed build
+        failed.result()
@@ -1,29 +1,53 @@
-import os, shutil
+import copy, hashlib, os, shutil, sys
 import re
 from typing import cast, BinaryIO, Optional, Sequence, Union
+from collections.abc import Mapping
 
+from build import cache
 from build.download import download_basename, download_and_verify
+from build.verify import feed_file_path
 from build.tar import untar
 from build.quilt import push_all
 from .toolchain import AnyToolchain
 
+# the top-level MPD source directory; patch paths are relative to it
+_srcdir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+_tarball_re = re.compile(r'^(.+)\.(tar(\.(gz|bz2|xz|lzma))?|zip)$')
+_base_re = re.compile(r'^([-\w]+)-(\d[\d.]*[a-z]?[\d.]*(?:-(?:alpha|beta)\d+)?)(\+.*)?$')
+
+def get_command_digest(command: Sequence[str], env: Mapping[str, str],
+                       *extra: str) -> str:
+    """Calculate a digest of a command line, the environment variables
+    which differ from the build host's environment and any additional
+    inputs (e.g. generated files)."""
+
+    # DESTDIR is only set while staging a build for the build cache
+    # and does not influence the result
+    env = {k: v for k, v in env.items()
+           if os.environ.get(k) != v and k != 'DESTDIR'}
+    return hashlib.sha256(repr((
+        list(command), sorted(env.items()), extra,
+    )).encode()).hexdigest()
+
 class Project:
     def __init__(self, url: Union[str, Sequence[str]], md5: str, installed: str,
                  name: Optional[str]=None, version: Optional[str]=None,
                  base: Optional[str]=None,
                  patches: Optional[str]=None,
                  edits=None,
-                 use_cxx: bool=False):
+                 use_cxx: bool=False,
+                 depends: Sequence['Project']=[]):
         if base is None:
             basename = download_basename(url)
-            m = re.match(r'^(.+)\.(tar(\.(gz|bz2|xz|lzma))?|zip)$', basename)
+            m = _tarball_re.match(basename)
             if not m: raise RuntimeError('Could not identify tarball name: ' + basename)
             self.base = m.group(1)
         else:
             self.base = base
 
         if name is None or version is None:
-            m = re.match(r'^([-\w]+)-(\d[\d.]*[a-z]?[\d.]*(?:-(?:alpha|beta)\d+)?)(\+.*)?$', self.base)
+            m = _base_re.match(self.base)
             if not m: raise RuntimeError('Could not identify tarball name: ' + self.base)
             if name is None: name = m.group(1)
             if version is None: version = m.group(2)
@@ -36,11 +60,18 @@ class Project:
         self.installed = installed
 
         if patches is not None:
-            srcdir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-            patches = os.path.join(srcdir, patches)
+            patches = os.path.join(_srcdir, patches)
         self.patches = patches
         self.edits = edits
         self.use_cxx = use_cxx
+        self.depends = depends
+
+        # the number of parallel compiler jobs and the load average
+        # above which no new jobs are started; None lets the build
+        # system decide (set by build_all(), so concurrent builds
+        # throttle each other)
+        self.jobs: Optional[int] = None
+        self.max_load: Optional[int] = None
 
     def download(self, toolchain: AnyToolchain) -> str:
         return download_and_verify(self.url, self.md5, toolchain.tarball_path)
@@ -54,6 +85,12 @@ class Project:
         except FileNotFoundError:
             return False
 
+    def get_src_path(self, toolchain: AnyToolchain, out_of_tree: bool=True) -> str:
+        if out_of_tree:
+            return os.path.join(toolchain.src_path, self.base)
+        else:
+            return os.path.join(toolchain.build_path, self.base)
+
     def unpack(self, toolchain: AnyToolchain, out_of_tree: bool=True) -> str:
         if out_of_tree:
             parent_path = toolchain.src_path
@@ -75,8 +112,11 @@ class Project:
 
         return path
 
+    def get_build_path(self, toolchain: AnyToolchain) -> str:
+        return os.path.join(toolchain.build_path, self.base)
+
     def make_build_path(self, toolchain: AnyToolchain, lazy: bool=False) -> str:
-        path = os.path.join(toolchain.build_path, self.base)
+        path = self.get_build_path(toolchain)
         if lazy and os.path.isdir(path):
             return path
         try:
@@ -86,5 +126,98 @@ class Project:
         os.makedirs(path, exist_ok=True)
         return path
 
+    def get_configure_command(self, toolchain: AnyToolchain) -> tuple[list[str], Mapping[str, str]]:
+        """Return the configure command line and its environment
+        without running it."""
+
+        raise NotImplementedError
+
+    def get_configure_digest(self, toolchain: AnyToolchain) -> str:
+        """Calculate a digest of everything which influences the
+        configure step."""
+
+        command, env = self.get_configure_command(toolchain)
+        return get_command_digest(command, env)
+
+    def is_configured(self, toolchain: AnyToolchain, marker: str, digest: str) -> bool:
+        """Check whether the build directory has already been
+        configured with the given digest and contains the given marker
+        file (e.g. CMakeCache.txt)."""
+
+        path = self.get_build_path(toolchain)
+        try:
+            with open(os.path.join(path, '.configure_digest')) as f:
+                if f.read() != digest:
+                    return False
+        except FileNotFoundError:
+            return False
+        return os.path.exists(os.path.join(path, marker))
+
+    def write_configure_digest(self, build: str, digest: str) -> None:
+        with open(os.path.join(build, '.configure_digest'), 'w') as f:
+            f.write(digest)
+
+    def get_cache_key(self, toolchain: AnyToolchain) -> str:
+        """Calculate a digest of everything which influences the
+        build result, to be used as key for the build cache."""
+
+        h = hashlib.sha256()
+        h.update(self.get_configure_digest(toolchain).encode())
+        h.update(repr((
+            toolchain.host_triplet, toolchain.install_prefix,
+            toolchain.cc, toolchain.cxx, toolchain.ar, toolchain.arflags,
+            toolchain.ranlib, toolchain.nm, toolchain.strip,
+            toolchain.cflags, toolchain.cxxflags, toolchain.cppflags,
+            toolchain.ldflags, toolchain.libs,
+        )).encode())
+        for name, value in sorted(vars(self).items()):
+            if name not in ('patches', 'edits', 'depends', 'jobs', 'max_load'):
+                h.update(repr((name, value)).encode())
+
+        if self.edits is not None:
+            h.update(repr(sorted(self.edits)).encode())
+
+        if self.patches is not None:
+            for dirpath, dirnames, filenames in sorted(os.walk(self.patches)):
+                for name in sorted(filenames):
+                    feed_file_path(h, os.path.join(dirpath, name))
+
+        # the code which builds this project, e.g. make arguments which
+        # are not part of the configure command line
+        for path in sorted({sys.modules[c.__module__].__file__
+                            for c in type(self).__mro__ if c is not object}):
+            feed_file_path(h, path)
+
+        for d in self.depends:
+            h.update(d.get_cache_key(toolchain).encode())
+
+        return h.hexdigest()
+
     def build(self, toolchain: AnyToolchain) -> None:
-        self._build(toolchain)
+        if cache.cache_path is None:
+            self._build(toolchain)
+            return
+
+        archive = os.path.join(cache.cache_path,
+                               f'{self.name}-{self.get_cache_key(toolchain)}.tar.gz')
+        if not os.path.isfile(archive):
+            # install into a staging directory (which contains only
+            # files of this project) and archive it
+            stage = os.path.join(toolchain.build_path, self.base + '.stage')
+            try:
+                shutil.rmtree(stage)
+            except FileNotFoundError:
+                pass
+
+            staging_toolchain = copy.copy(toolchain)
+            staging_toolchain.env = {**toolchain.env, 'DESTDIR': stage}
+            self._build(staging_toolchain)
+
+            cache.store(archive, os.path.join(stage, toolchain.install_prefix.lstrip(os.sep)))
+            shutil.rmtree(stage)
+
+        print("restore", self.name, "from", archive)
+        cache.restore(archive, toolchain.install_prefix)
+
+        # make is_installed() see this build as newer than the tarball
+        os.utime(os.path.join(toolchain.install_prefix, self.installed))
@@ -10,11 +10,19 @@ def untar(tarball_path: str, parent_path: str, base: str,
     except FileNotFoundError:
         pass
     os.makedirs(parent_path, exist_ok=True)
+    command = ['tar', '-x', '-f', tarball_path, '-C', parent_path]
+    if tarball_path.endswith('.xz') and shutil.which('xz') is not None:
+        # let xz use multiple threads (only effective if the tarball
+        # was compressed in multiple blocks)
+        command.insert(1, '--use-compress-program=xz -T0')
     try:
-        subprocess.check_call(['tar', 'xfC', tarball_path, parent_path])
+        subprocess.check_call(command)
     except FileNotFoundError:
         import tarfile
         tar = tarfile.open(tarball_path)
-        tar.extractall(path=parent_path)
+        if hasattr(tarfile, 'data_filter'):
+            tar.extractall(path=parent_path, filter='data')
+        else:
+            tar.extractall(path=parent_path)
         tar.close()
     return path
@@ -4,7 +4,9 @@ import shutil
 from typing import Union
 
 def with_ccache(command: str) -> str:
-    ccache = shutil.which('ccache')
+    # prefer ccache, but fall back to sccache if that is what the
+    # build host has
+    ccache = shutil.which('ccache') or shutil.which('sccache')
     if ccache is None:
         return command
     else:
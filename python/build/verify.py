@@ -20,6 +20,11 @@ def feed_file_path(h: Any, path: str) -> None:
 def file_digest(algorithm: Any, path: str) -> str:
     """Calculate the digest of a file and return it in hexadecimal notation."""
 
+    if hasattr(hashlib, 'file_digest'):
+        # Python 3.11+ reads the file without a Python-level loop
+        with open(path, 'rb') as f:
+            return cast(str, hashlib.file_digest(f, algorithm).hexdigest())
+
     h = algorithm()
     feed_file_path(h, path)
     return cast(str, h.hexdigest())
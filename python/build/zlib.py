@@ -1,5 +1,6 @@
 import subprocess
 from typing import Optional, Sequence, Union
+from collections.abc import Mapping
 
 from build.makeproject import MakeProject
 from .toolchain import AnyToolchain
@@ -24,11 +25,14 @@ class ZlibProject(MakeProject):
         return [
             'RANLIB=' + toolchain.ranlib,
             self.install_target
-        ]
+        ] + self.get_destdir_args(toolchain)
+
+    def get_configure_command(self, toolchain: AnyToolchain) -> tuple[list[str], Mapping[str, str]]:
+        return ['./configure', '--prefix=' + toolchain.install_prefix, '--static'], toolchain.env
 
     def _build(self, toolchain: AnyToolchain) -> None:
         src = self.unpack(toolchain, out_of_tree=False)
 
-        subprocess.check_call(['./configure', '--prefix=' + toolchain.install_prefix, '--static'],
-                              cwd=src, env=toolchain.env)
+        configure, env = self.get_configure_command(toolchain)
+        subprocess.check_call(configure, cwd=src, env=env)
         self.build_make(toolchain, src)
@@ -53,9 +53,8 @@ toolchain = MingwToolchain(mpd_path,
                            '/usr', host_arch, x64,
                            tarball_path, src_path, build_path, root_path)
 
-for x in thirdparty_libs:
-    if not x.is_installed(toolchain):
-        x.build(toolchain)
+from build.parallel import build_all
+build_all(thirdparty_libs, lambda x: toolchain)
 
 # configure and build MPD
 